@@ -1,10 +1,89 @@
-import asyncio
-import logging
-from typing import Dict, Any, Callable, Awaitable
+from typing import Dict, Any, Callable, Awaitable, Optional
 
-logger = logging.getLogger(__name__)
+from .caching import (
+    MarketConditionsCache, MarketDataCache, shared_market_conditions_cache, shared_price_cache
+)
+from .core import Dependencies, FrontRunStrategy, ScoringSpec
 
-class AdvancedFrontRunStrategy:
+# Bits of the packed "flags" entry that check_market_conditions_func may return.
+MARKET_BULLISH = 1
+MARKET_VOLATILE = 2
+MARKET_LIQUID = 4
+
+_TREND_LABELS = ("Bearish", "Bullish")
+_VOLATILITY_LABELS = ("Low", "High")
+_LIQUIDITY_LABELS = ("Low", "Adequate")
+
+
+def pack_market_flags(market_conditions: Dict[str, Any]) -> int:
+    """
+    Packs the boolean market condition fields into a single int.
+
+    Returns ``market_conditions["flags"]`` unchanged when the market monitor
+    already provides it, otherwise derives it from the ``bullish_trend``,
+    ``high_volatility`` and ``low_liquidity`` fields.
+    """
+    flags = market_conditions.get("flags")
+    if flags is not None:
+        return flags
+    return (
+        (MARKET_BULLISH if market_conditions.get("bullish_trend", False) else 0)
+        | (MARKET_VOLATILE if market_conditions.get("high_volatility", False) else 0)
+        | (0 if market_conditions.get("low_liquidity", True) else MARKET_LIQUID)
+    )
+
+
+def _fetch_data(
+    deps: Dependencies, target_tx: Dict[str, Any], token_symbol: str
+) -> Dict[str, Awaitable[Any]]:
+    contract_address = target_tx["to"]
+    return {
+        "predicted_price": deps["predict_price_movement"](token_symbol),
+        "market_conditions": deps["check_market_conditions"](contract_address),
+        "current_price": deps["get_real_time_price"](token_symbol),
+        "volume": deps["get_token_volume"](token_symbol),
+    }
+
+
+async def _score(
+    deps: Dependencies, target_tx: Dict[str, Any], token_symbol: str, data: Dict[str, Any]
+) -> float:
+    price_increase = (data["predicted_price"] / float(data["current_price"]) - 1) * 100
+    data["price_increase"] = price_increase
+    risk_score, _ = await deps["calculate_risk_score"](
+        target_tx,
+        token_symbol,
+        price_change=price_increase
+    )
+    return risk_score
+
+
+def _describe(token_symbol: str, data: Dict[str, Any], risk_score: float) -> str:
+    # Market flags are only reported, the risk scorer makes the decision.
+    flags = pack_market_flags(data["market_conditions"])
+    return (
+        f"Analysis for {token_symbol}:\n"
+        f"Price Increase: {data['price_increase']:.2f}%\n"
+        f"Market Trend: {_TREND_LABELS[flags & MARKET_BULLISH]}\n"
+        f"Volatility: {_VOLATILITY_LABELS[(flags & MARKET_VOLATILE) >> 1]}\n"
+        f"Liquidity: {_LIQUIDITY_LABELS[(flags & MARKET_LIQUID) >> 2]}\n"
+        f"24h Volume: ${data['volume']:,.2f}\n"
+        f"Risk Score: {risk_score}/100"
+    )
+
+
+ADVANCED_SPEC = ScoringSpec(
+    name="Advanced",
+    threshold_key="ADVANCED_FRONT_RUN_RISK_SCORE_THRESHOLD",
+    default_threshold=70,
+    data_fetchers=_fetch_data,
+    score_fn=_score,
+    required=("current_price", "predicted_price"),
+    describe=_describe,
+)
+
+
+class AdvancedFrontRunStrategy(FrontRunStrategy):
     """
     Advanced front-run strategy class.
 
@@ -12,6 +91,8 @@ class AdvancedFrontRunStrategy:
     front-running approach.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         validate_transaction_func: Callable[..., Awaitable[tuple[bool, dict, str]]],
@@ -21,7 +102,9 @@ class AdvancedFrontRunStrategy:
         check_market_conditions_func: Callable[[str], Awaitable[dict]],
         get_real_time_price_func: Callable[[str], Awaitable[float]],
         get_token_volume_func: Callable[[str], Awaitable[float]],
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        market_conditions_cache: Optional[MarketConditionsCache] = None,
+        price_cache: Optional[MarketDataCache] = None
     ):
         """
         Initializes the AdvancedFrontRunStrategy.
@@ -35,88 +118,32 @@ class AdvancedFrontRunStrategy:
             get_real_time_price_func: Asynchronous function to get real-time price.
             get_token_volume_func: Asynchronous function to get token volume.
             config: Configuration dictionary.
+            market_conditions_cache: Cache used for market conditions lookups. Defaults
+                to the process-wide cache shared by all strategies.
+            price_cache: Cache used for price, volume and prediction lookups. Defaults
+                to the process-wide cache shared by all strategies.
         """
-        self._validate_transaction = validate_transaction_func
-        self._calculate_risk_score = calculate_risk_score_func
-        self._front_run = front_run_func
-        self._predict_price_movement = predict_price_movement_func
-        self._check_market_conditions = check_market_conditions_func
-        self._get_real_time_price = get_real_time_price_func
-        self._get_token_volume = get_token_volume_func
-        self.config = config
-        self.risk_score_threshold = config.get("ADVANCED_FRONT_RUN_RISK_SCORE_THRESHOLD", 70) # Default
-
-
-    async def execute(self, target_tx: Dict[str, Any]) -> bool:
-        """
-        Executes the advanced front-run strategy.
-
-        Args:
-            target_tx: The target transaction dictionary.
-
-        Returns:
-            True if front-run was executed, False otherwise.
-        """
-        logger.debug("Initiating Advanced Front-Run Strategy...")
-
-        valid, decoded_tx, token_symbol = await self._validate_transaction(
-            target_tx, "front_run"
-        )
-        if not valid:
-            return False
-
-        try:
-             analysis_results = await asyncio.gather(
-                 self._predict_price_movement(token_symbol),
-                 self._check_market_conditions(target_tx["to"]),
-                 self._get_real_time_price(token_symbol),
-                self._get_token_volume(token_symbol),
-                return_exceptions=True
-             )
-
-             predicted_price, market_conditions, current_price, volume = analysis_results
-
-             if any(isinstance(result, Exception) for result in analysis_results):
-                 logger.warning("Failed to gather complete market data.")
-                 return False
-
-             if current_price is None or predicted_price is None:
-                 logger.debug("Missing price data for analysis. Skipping...")
-                 return False
-
-        except Exception as e:
-            logger.error(f"Error gathering market data: {e}")
-            return False
-
-        price_increase = (predicted_price / float(current_price) - 1) * 100
-        is_bullish = market_conditions.get("bullish_trend", False)
-        is_volatile = market_conditions.get("high_volatility", False)
-        has_liquidity = not market_conditions.get("low_liquidity", True)
-
-        risk_score, market_conditions = await self._calculate_risk_score(
-            target_tx,
-            token_symbol,
-            price_change=price_increase
-        )
-
-        logger.debug(
-            f"Analysis for {token_symbol}:\n"
-            f"Price Increase: {price_increase:.2f}%\n"
-            f"Market Trend: {'Bullish' if is_bullish else 'Bearish'}\n"
-            f"Volatility: {'High' if is_volatile else 'Low'}\n"
-            f"Liquidity: {'Adequate' if has_liquidity else 'Low'}\n"
-            f"24h Volume: ${volume:,.2f}\n"
-            f"Risk Score: {risk_score}/100"
+        price_cache = price_cache or shared_price_cache
+        super().__init__(
+            ADVANCED_SPEC,
+            validate_transaction_func,
+            front_run_func,
+            dependencies={
+                "calculate_risk_score": calculate_risk_score_func,
+                "predict_price_movement": price_cache.wrap(predict_price_movement_func),
+                "check_market_conditions": (
+                    market_conditions_cache or shared_market_conditions_cache
+                ).wrap(check_market_conditions_func),
+                "get_real_time_price": price_cache.wrap(get_real_time_price_func),
+                "get_token_volume": price_cache.wrap(get_token_volume_func),
+            },
+            config=config,
         )
 
-        if risk_score >= self.risk_score_threshold:
-            logger.debug(
-                f"Executing advanced front-run for {token_symbol} "
-                f"(Risk Score: {risk_score}/100)"
-            )
-            return await self._front_run(target_tx)
+    @property
+    def risk_score_threshold(self) -> int:
+        return self.threshold
 
-        logger.debug(
-            f"Risk score {risk_score}/100 below threshold. Skipping front-run."
-        )
-        return False
+    @risk_score_threshold.setter
+    def risk_score_threshold(self, value: int) -> None:
+        self._set_threshold(value)
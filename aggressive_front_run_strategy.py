@@ -1,10 +1,36 @@
-import asyncio
-import logging
-from typing import Dict, Any, Callable, Awaitable
+from typing import Dict, Any, Callable, Awaitable, Optional
 
-logger = logging.getLogger(__name__)
+from .caching import MarketDataCache, shared_price_cache
+from .core import Dependencies, FrontRunStrategy, ScoringSpec
 
-class AggressiveFrontRunStrategy:
+
+def _fetch_data(
+    deps: Dependencies, target_tx: Dict[str, Any], token_symbol: str
+) -> Dict[str, Awaitable[Any]]:
+    return {"price_change_24h": deps["get_price_change_24h"](token_symbol)}
+
+
+async def _score(
+    deps: Dependencies, target_tx: Dict[str, Any], token_symbol: str, data: Dict[str, Any]
+) -> float:
+    risk_score, market_conditions = await deps["calculate_risk_score"](
+        target_tx,
+        token_symbol,
+        price_change=data["price_change_24h"]
+    )
+    return risk_score
+
+
+AGGRESSIVE_SPEC = ScoringSpec(
+    name="Aggressive",
+    threshold_key="AGGRESSIVE_FRONT_RUN_RISK_SCORE_THRESHOLD",
+    default_threshold=70,
+    data_fetchers=_fetch_data,
+    score_fn=_score,
+)
+
+
+class AggressiveFrontRunStrategy(FrontRunStrategy):
     """
     Aggressive front-run strategy class.
 
@@ -13,13 +39,19 @@ class AggressiveFrontRunStrategy:
     action based on simpler risk analysis is preferred.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         validate_transaction_func: Callable[..., Awaitable[tuple[bool, dict, str]]],
         calculate_risk_score_func: Callable[..., Awaitable[tuple[float, dict]]],
         front_run_func: Callable[..., Awaitable[bool]],
         get_price_change_24h_func: Callable[[str], Awaitable[float]],
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        validate_transactions_func: Optional[
+            Callable[..., Awaitable[list[tuple[bool, dict, str]]]]
+        ] = None,
+        price_cache: Optional[MarketDataCache] = None
     ):
         """
         Initializes the AggressiveFrontRunStrategy.
@@ -30,43 +62,40 @@ class AggressiveFrontRunStrategy:
             front_run_func: Asynchronous function to execute a front-run.
             get_price_change_24h_func: Asynchronous function to get 24h price change.
             config: Configuration dictionary containing strategy parameters.
+            validate_transactions_func: Optional asynchronous function validating a
+                list of transactions in one call, used by ``execute_batch``. Falls
+                back to concurrent ``validate_transaction_func`` calls if omitted.
+            price_cache: Cache used for 24h price change lookups. Defaults to the
+                process-wide cache shared by all strategies.
         """
-        self._validate_transaction = validate_transaction_func
-        self._calculate_risk_score = calculate_risk_score_func
-        self._front_run = front_run_func
-        self._get_price_change_24h = get_price_change_24h_func
-        self.config = config
-        self.min_value_eth = config.get("AGGRESSIVE_FRONT_RUN_MIN_VALUE_ETH", 0.01) # Default value
-        self.risk_score_threshold = config.get("AGGRESSIVE_FRONT_RUN_RISK_SCORE_THRESHOLD", 70) # Default value
-
-
-    async def execute(self, target_tx: Dict[str, Any]) -> bool:
-        """
-        Executes the aggressive front-run strategy.
-
-        Args:
-            target_tx: The target transaction dictionary.
+        price_cache = price_cache or shared_price_cache
+        super().__init__(
+            AGGRESSIVE_SPEC,
+            validate_transaction_func,
+            front_run_func,
+            dependencies={
+                "calculate_risk_score": calculate_risk_score_func,
+                "get_price_change_24h": price_cache.wrap(get_price_change_24h_func),
+            },
+            config=config,
+            validate_kwargs={
+                "min_value": config.get("AGGRESSIVE_FRONT_RUN_MIN_VALUE_ETH", 0.01) # Default value
+            },
+            validate_transactions_func=validate_transactions_func,
+        )
 
-        Returns:
-            True if front-run was executed, False otherwise.
-        """
-        logger.debug("Initiating Aggressive Front-Run Strategy...")
+    @property
+    def min_value_eth(self) -> float:
+        return self._validate_kwargs["min_value"]
 
-        valid, decoded_tx, token_symbol = await self._validate_transaction(
-            target_tx, "front_run", min_value=self.min_value_eth
-        )
-        if not valid:
-            return False
-
-        price_change_24h = await self._get_price_change_24h(token_symbol)
-        risk_score, market_conditions = await self._calculate_risk_score(
-            target_tx,
-            token_symbol,
-            price_change=price_change_24h
-        )
+    @min_value_eth.setter
+    def min_value_eth(self, value: float) -> None:
+        self._validate_kwargs["min_value"] = value
 
-        if risk_score >= self.risk_score_threshold:
-            logger.debug(f"Executing aggressive front-run (Risk: {risk_score:.2f})")
-            return await self._front_run(target_tx)
+    @property
+    def risk_score_threshold(self) -> int:
+        return self.threshold
 
-        return False
+    @risk_score_threshold.setter
+    def risk_score_threshold(self, value: int) -> None:
+        self._set_threshold(value)
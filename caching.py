@@ -0,0 +1,384 @@
+import asyncio
+import os
+import sqlite3
+import time
+from array import array
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+DEFAULT_PRICE_CACHE_MAXSIZE = 1024
+DEFAULT_PRICE_CACHE_TTL = 2.0 # Seconds, roughly one L2 block
+DEFAULT_MARKET_CONDITIONS_CACHE_MAXSIZE = 256
+DEFAULT_MARKET_CONDITIONS_CACHE_TTL = 12.0 # Seconds, one Ethereum block
+DEFAULT_DISK_CACHE_BUCKET_SECONDS = 3600 # Historical data is reused within the hour
+DEFAULT_DISK_CACHE_MAX_AGE = 7 * 24 * 3600.0 # Seconds a stored result is kept on disk
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Bounded mapping whose entries expire after a fixed time-to-live.
+
+    Entries are evicted in least-recently-stored order once ``maxsize`` is
+    exceeded, and lazily on lookup once they are older than ``ttl`` seconds.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        timer: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initializes the TTLCache.
+
+        Args:
+            maxsize: Maximum number of entries kept in the cache.
+            ttl: Time-to-live of an entry in seconds.
+            timer: Monotonic clock used to expire entries.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the cached value for ``key``, or ``default`` if absent or expired.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= self._timer():
+            del self._data[key]
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Stores ``value`` under ``key``, evicting the oldest entry if full.
+        """
+        self._data[key] = (self._timer() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes all entries from the cache.
+        """
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class CachedPriceClient:
+    """
+    Memoizing wrapper around an asynchronous market data lookup.
+
+    Results are cached per call arguments for a short time-to-live, so that
+    repeated lookups for the same token within one block are served from
+    memory. Concurrent misses for the same arguments are coalesced into a
+    single upstream call. Exceptions are propagated and never cached.
+    """
+
+    def __init__(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        maxsize: int = DEFAULT_PRICE_CACHE_MAXSIZE,
+        ttl: float = DEFAULT_PRICE_CACHE_TTL
+    ):
+        """
+        Initializes the CachedPriceClient.
+
+        Args:
+            func: Asynchronous function whose results should be cached.
+            maxsize: Maximum number of cached results.
+            ttl: Time-to-live of a cached result in seconds.
+        """
+        self._func = func
+        self._cache = TTLCache(maxsize, ttl)
+        self._pending: dict[Hashable, asyncio.Future] = {}
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+
+        value = self._cache.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        future = self._pending.get(key)
+        if future is not None and future.get_loop() is not asyncio.get_running_loop():
+            # Left over from an event loop that has since been closed.
+            future = None
+        if future is None:
+            future = asyncio.ensure_future(self._func(*args, **kwargs))
+            self._pending[key] = future
+            future.add_done_callback(lambda f: self._store(key, f))
+
+        # Shield the shared upstream call so one cancelled caller does not
+        # cancel it for everybody else waiting on the same key.
+        return await asyncio.shield(future)
+
+    def _store(self, key: Hashable, future: asyncio.Future) -> None:
+        self._pending.pop(key, None)
+        if not future.cancelled() and future.exception() is None:
+            self._cache.set(key, future.result())
+
+    def invalidate(self) -> None:
+        """
+        Drops all cached results, e.g. when a new block is observed.
+        """
+        self._cache.clear()
+
+
+def memoize_async(
+    func: Callable[..., Awaitable[Any]],
+    maxsize: int = DEFAULT_PRICE_CACHE_MAXSIZE,
+    ttl: float = DEFAULT_PRICE_CACHE_TTL
+) -> CachedPriceClient:
+    """
+    Wraps an asynchronous function in a :class:`CachedPriceClient`.
+
+    Functions that are already wrapped are returned unchanged, so a single
+    client can be shared between several strategies.
+
+    Args:
+        func: Asynchronous function whose results should be cached.
+        maxsize: Maximum number of cached results.
+        ttl: Time-to-live of a cached result in seconds.
+
+    Returns:
+        The memoized function.
+    """
+    if isinstance(func, CachedPriceClient):
+        return func
+    return CachedPriceClient(func, maxsize=maxsize, ttl=ttl)
+
+
+class MarketDataCache:
+    """
+    Registry of memoized market data lookups, one client per function.
+
+    Wrapping the same function twice returns the same :class:`CachedPriceClient`,
+    so every strategy sharing a MarketDataCache also shares its cached results
+    and in-flight calls, without having to wrap the functions up front.
+
+    The cache keeps every wrapped function, and the object it is bound to,
+    alive until :meth:`clear` is called. Long-running processes that create
+    new API clients or market monitors, or run several event loops one after
+    another, should clear the cache when replacing them.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_PRICE_CACHE_MAXSIZE,
+        ttl: float = DEFAULT_PRICE_CACHE_TTL
+    ):
+        """
+        Initializes the MarketDataCache.
+
+        Args:
+            maxsize: Maximum number of cached results per function.
+            ttl: Time-to-live of a cached result in seconds.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clients: dict[Callable[..., Awaitable[Any]], CachedPriceClient] = {}
+
+    def wrap(self, func: Callable[..., Awaitable[Any]]) -> CachedPriceClient:
+        """
+        Returns the memoized version of a market data function.
+
+        Args:
+            func: Asynchronous function whose results should be cached.
+
+        Returns:
+            The memoized function, shared by all callers wrapping ``func``.
+        """
+        if isinstance(func, CachedPriceClient):
+            return func
+        client = self._clients.get(func)
+        if client is None:
+            client = CachedPriceClient(func, maxsize=self.maxsize, ttl=self.ttl)
+            self._clients[func] = client
+        return client
+
+    def invalidate(self) -> None:
+        """
+        Drops all cached results, e.g. when a new block is observed.
+        """
+        for client in self._clients.values():
+            client.invalidate()
+
+    def clear(self) -> None:
+        """
+        Drops all wrapped functions together with their cached results.
+
+        Clients handed out earlier keep working on their own, later ``wrap``
+        calls create new ones.
+        """
+        self._clients.clear()
+
+
+class MarketConditionsCache(MarketDataCache):
+    """
+    Per-block cache of market conditions keyed by contract address.
+
+    Most target transactions go to a handful of router contracts whose market
+    conditions do not change within a block, so results are kept for one
+    block instead of the couple of seconds used for prices.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MARKET_CONDITIONS_CACHE_MAXSIZE,
+        ttl: float = DEFAULT_MARKET_CONDITIONS_CACHE_TTL
+    ):
+        """
+        Initializes the MarketConditionsCache.
+
+        Args:
+            maxsize: Maximum number of cached contract addresses per function.
+            ttl: Time-to-live of cached market conditions in seconds, e.g. 12 for
+                Ethereum mainnet or 2 for most L2s.
+        """
+        super().__init__(maxsize=maxsize, ttl=ttl)
+
+
+shared_price_cache = MarketDataCache()
+shared_market_conditions_cache = MarketConditionsCache()
+
+
+class DiskPriceCache:
+    """
+    Persistent cache for historical price data lookups.
+
+    Results of ``get_token_price_data_func`` are stored in a SQLite database
+    keyed by token symbol, data type, timeframe and time bucket, so repeated
+    backtests and replays read them from local disk instead of the network.
+    Prices are stored as packed doubles to avoid any parsing on reload.
+    Lookups are synchronous, which is fine for a local database but means
+    the cache directory should be on fast local storage.
+
+    The time bucket comes from ``timer``. Backtests should pass a clock
+    returning the replayed block or transaction time, so that re-runs hit
+    the same entries no matter when they are started. Results stored more
+    than ``max_age`` seconds ago (wall-clock) are pruned.
+    """
+
+    def __init__(
+        self,
+        func: Callable[..., Awaitable[Optional[list[float]]]],
+        cache_dir: str,
+        bucket_seconds: int = DEFAULT_DISK_CACHE_BUCKET_SECONDS,
+        timer: Callable[[], float] = time.time,
+        max_age: float = DEFAULT_DISK_CACHE_MAX_AGE
+    ):
+        """
+        Initializes the DiskPriceCache.
+
+        Args:
+            func: Asynchronous function to get historical price data.
+            cache_dir: Directory holding the cache database, created if missing.
+            bucket_seconds: Width of the time bucket a cached result is valid for.
+            timer: Clock in seconds the time bucket is taken from, e.g. the
+                replayed block timestamp when backtesting.
+            max_age: Seconds after which a stored result is pruned.
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        self._func = func
+        self._bucket_seconds = bucket_seconds
+        self._timer = timer
+        self._max_age = max_age
+        self._next_prune = 0.0
+        self._db = sqlite3.connect(os.path.join(cache_dir, "price_data.sqlite3"))
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS price_data ("
+            "symbol TEXT, data_type TEXT, timeframe INTEGER, bucket INTEGER, prices BLOB, "
+            "stored_at REAL, PRIMARY KEY (symbol, data_type, timeframe, bucket))"
+        )
+        self._prune()
+
+    async def __call__(
+        self, token_symbol: str, data_type: str, timeframe: int
+    ) -> Optional[list[float]]:
+        key = (token_symbol, data_type, timeframe, int(self._timer() // self._bucket_seconds))
+
+        row = self._db.execute(
+            "SELECT prices FROM price_data "
+            "WHERE symbol = ? AND data_type = ? AND timeframe = ? AND bucket = ?",
+            key
+        ).fetchone()
+        if row is not None:
+            prices = array("d")
+            prices.frombytes(row[0])
+            return prices.tolist()
+
+        result = await self._func(token_symbol, data_type, timeframe=timeframe)
+        if result is not None:
+            try:
+                packed = array("d", result).tobytes()
+            except (TypeError, OverflowError):
+                # Gaps (None) or non-float values cannot be packed, serve them uncached.
+                return result
+            self._db.execute(
+                "INSERT OR REPLACE INTO price_data VALUES (?, ?, ?, ?, ?, ?)",
+                (*key, packed, time.time())
+            )
+            if time.time() >= self._next_prune:
+                self._prune()
+            else:
+                self._db.commit()
+        return result
+
+    def _prune(self) -> None:
+        # Runs at most once per bucket, stale rows only cost disk space.
+        now = time.time()
+        self._db.execute("DELETE FROM price_data WHERE stored_at < ?", (now - self._max_age,))
+        self._db.commit()
+        self._next_prune = now + self._bucket_seconds
+
+    def close(self) -> None:
+        """
+        Closes the cache database.
+        """
+        self._db.close()
+
+
+def cache_price_data(
+    func: Callable[..., Awaitable[Optional[list[float]]]],
+    disk_cache_dir: Optional[str] = None,
+    price_cache: Optional[MarketDataCache] = None,
+    disk_cache_timer: Callable[[], float] = time.time
+) -> CachedPriceClient:
+    """
+    Wraps a historical price data function in the in-memory and disk caches.
+
+    Args:
+        func: Asynchronous function to get historical price data.
+        disk_cache_dir: Directory of the persistent cache. Only the in-memory
+            cache is used if omitted.
+        price_cache: Registry providing the in-memory cache when no disk cache
+            is used. Defaults to the process-wide ``shared_price_cache``.
+        disk_cache_timer: Clock the disk cache buckets are taken from, e.g. the
+            replayed block timestamp when backtesting.
+
+    Returns:
+        The memoized function.
+
+    Raises:
+        ValueError: If ``disk_cache_dir`` is given for an already memoized
+            function, whose cache would otherwise bypass the disk.
+    """
+    if disk_cache_dir is not None:
+        if isinstance(func, CachedPriceClient):
+            raise ValueError(
+                "disk_cache_dir requires the unwrapped price data function, "
+                "wrap it in a DiskPriceCache before memoizing it to share it"
+            )
+        return memoize_async(DiskPriceCache(func, disk_cache_dir, timer=disk_cache_timer))
+    return (price_cache or shared_price_cache).wrap(func)
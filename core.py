@@ -0,0 +1,358 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Dict, Any, Callable, Awaitable, List, Mapping, Optional
+
+Dependencies = Mapping[str, Callable[..., Awaitable[Any]]]
+
+# "0x" followed by a 4-byte function selector.
+_MIN_CALLDATA_HEX_LENGTH = 10
+
+
+def _parse_wei(value: Any) -> Optional[int]:
+    """
+    Parses a transaction value given as an int, hex string or decimal string.
+
+    Returns None if the value cannot be interpreted as an amount of wei.
+    """
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value, 16) if value[:2].lower() == "0x" else int(value)
+        except ValueError:
+            return None
+    return None
+
+
+def cheap_precheck(
+    target_tx: Dict[str, Any],
+    min_value_wei: int = 0,
+    router_allowlist: frozenset[str] = frozenset()
+) -> bool:
+    """
+    Rejects obviously uninteresting transactions without any network I/O.
+
+    A transaction passes if it carries calldata with at least a function
+    selector, its value reaches ``min_value_wei`` and, when
+    ``router_allowlist`` is not empty, it targets one of those routers
+    (lowercase addresses).
+    """
+    calldata = target_tx.get("data") or target_tx.get("input") or ""
+    if len(calldata) < (_MIN_CALLDATA_HEX_LENGTH if isinstance(calldata, str) else 4):
+        return False
+
+    if min_value_wei:
+        value = _parse_wei(target_tx.get("value", 0))
+        if value is None or value < min_value_wei:
+            return False
+
+    if router_allowlist:
+        router = target_tx.get("to")
+        if not isinstance(router, str) or router.lower() not in router_allowlist:
+            return False
+
+    return True
+
+
+async def _await(awaitable: Awaitable[Any]) -> Any:
+    return await awaitable
+
+
+async def _gather_data(awaitables: Dict[str, Awaitable[Any]]) -> Dict[str, Any]:
+    # A TaskGroup cancels the remaining lookups as soon as one of them fails,
+    # instead of waiting for the slowest upstream before giving up.
+    async with asyncio.TaskGroup() as tg:
+        # create_task() only takes coroutines, dependencies may return any awaitable.
+        tasks = {
+            name: tg.create_task(_await(awaitable))
+            for name, awaitable in awaitables.items()
+        }
+    return {name: task.result() for name, task in tasks.items()}
+
+
+@dataclass(frozen=True, slots=True)
+class ScoringSpec:
+    """
+    Describes what sets one front-run strategy apart from the others.
+
+    Attributes:
+        name: Human readable strategy name used in log messages.
+        threshold_key: Configuration key holding the score threshold.
+        default_threshold: Threshold used when ``threshold_key`` is not configured.
+            Thresholds must be whole points.
+        data_fetchers: Function returning the market data lookups to run
+            concurrently for a transaction, as a mapping of names to awaitables.
+            Called with the strategy dependencies, the target transaction and
+            its token symbol.
+        score_fn: Asynchronous function computing the score in [0, 100] from
+            the dependencies, the target transaction, its token symbol and the
+            fetched data. It may add derived values to the data
+            mapping for ``describe``.
+        required: Names of fetched values that must not be None.
+        describe: Optional function formatting the analysis log message from
+            the token symbol, the data and the score. Only called when DEBUG
+            logging is enabled.
+    """
+
+    name: str
+    threshold_key: str
+    default_threshold: int
+    data_fetchers: Callable[[Dependencies, Dict[str, Any], str], Dict[str, Awaitable[Any]]]
+    score_fn: Callable[[Dependencies, Dict[str, Any], str, Dict[str, Any]], Awaitable[float]]
+    required: tuple[str, ...] = ()
+    describe: Optional[Callable[[str, Dict[str, Any], float], str]] = None
+
+
+class FrontRunStrategy:
+    """
+    Generic front-run strategy driven by a :class:`ScoringSpec`.
+
+    Every strategy follows the same steps: pre-check and validate the target
+    transaction, gather market data concurrently, compute a score and
+    front-run if the score reaches the configured threshold, which is kept
+    in whole points.
+    """
+
+    __slots__ = (
+        "spec",
+        "config",
+        "_threshold",
+        "dependencies",
+        "_validate_transaction",
+        "_validate_transactions",
+        "_validate_kwargs",
+        "_front_run",
+        "_min_value_wei",
+        "_router_allowlist",
+        "_logger",
+    )
+
+    def __init__(
+        self,
+        spec: ScoringSpec,
+        validate_transaction_func: Callable[..., Awaitable[tuple[bool, dict, str]]],
+        front_run_func: Callable[..., Awaitable[bool]],
+        dependencies: Dependencies,
+        config: Dict[str, Any],
+        validate_kwargs: Optional[Dict[str, Any]] = None,
+        validate_transactions_func: Optional[
+            Callable[..., Awaitable[list[tuple[bool, dict, str]]]]
+        ] = None
+    ):
+        """
+        Initializes the FrontRunStrategy.
+
+        Args:
+            spec: The scoring specification of the strategy.
+            validate_transaction_func: Asynchronous function to validate a transaction.
+            front_run_func: Asynchronous function to execute a front-run.
+            dependencies: Asynchronous functions used by the spec, keyed by name.
+            config: Configuration dictionary.
+            validate_kwargs: Extra keyword arguments passed to the validator.
+            validate_transactions_func: Optional asynchronous function validating a
+                list of transactions in one call, used by ``execute_batch``. Falls
+                back to concurrent ``validate_transaction_func`` calls if omitted.
+
+        Raises:
+            ValueError: If the configured threshold is not a whole number of points.
+        """
+        self.spec = spec
+        self.config = config
+        self._set_threshold(config.get(spec.threshold_key, spec.default_threshold))
+        self.dependencies = dependencies
+        self._validate_transaction = validate_transaction_func
+        self._validate_transactions = validate_transactions_func
+        self._validate_kwargs = validate_kwargs or {}
+        self._front_run = front_run_func
+        self._min_value_wei = int(config.get("FRONT_RUN_MIN_VALUE_WEI", 0)) # Default, no minimum
+        self._router_allowlist = frozenset(
+            address.lower() for address in config.get("FRONT_RUN_ROUTER_ALLOWLIST", ())
+        ) # Default, any router
+        # Log through the strategy's own module, so per-module logger
+        # configuration keeps working.
+        self._logger = logging.getLogger(type(self).__module__)
+
+    @property
+    def threshold(self) -> int:
+        """
+        The score threshold in whole points. Read-only, strategies that expose
+        it under their own name validate writes through ``_set_threshold``.
+        """
+        return self._threshold
+
+    async def execute(
+        self,
+        target_tx: Dict[str, Any],
+        validation: Optional[tuple[bool, dict, str]] = None
+    ) -> bool:
+        """
+        Executes the front-run strategy.
+
+        Args:
+            target_tx: The target transaction dictionary.
+            validation: Result of validating ``target_tx`` if it is already known
+                (see ``validates_like``), e.g. from prefetching. The transaction
+                is validated here if omitted.
+
+        Returns:
+            True if front-run was executed, False otherwise.
+        """
+        self._logger.debug("Initiating %s Front-Run Strategy...", self.spec.name)
+
+        if not self.precheck(target_tx):
+            return False
+
+        if validation is None:
+            validation = await self._validate_transaction(
+                target_tx, "front_run", **self._validate_kwargs
+            )
+        valid, decoded_tx, token_symbol = validation
+        if not valid:
+            return False
+
+        score = await self._score(target_tx, token_symbol)
+        if score is None or not self._accepts(score, token_symbol):
+            return False
+        return await self._front_run(target_tx)
+
+    async def execute_batch(self, txs: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Executes the front-run strategy for a batch of transactions.
+
+        Transactions are validated in a single call and scored concurrently;
+        lookups shared between transactions are coalesced by the memoized
+        dependencies. Front-runs are then executed in the order the
+        transactions were given. A transaction whose scoring or front-run
+        fails is logged and counted as not front-run, the others go ahead.
+
+        Args:
+            txs: The target transaction dictionaries.
+
+        Returns:
+            A list with one entry per transaction, True if its front-run was
+            executed, False otherwise.
+
+        Raises:
+            ValueError: If ``validate_transactions_func`` does not return one
+                result per transaction.
+        """
+        self._logger.debug(
+            "Initiating %s Front-Run Strategy for %d transactions...", self.spec.name, len(txs)
+        )
+
+        results = [False] * len(txs)
+        precheck = self.precheck
+        indices = [index for index, tx in enumerate(txs) if precheck(tx)]
+        if not indices:
+            return results
+        prechecked = [txs[index] for index in indices]
+
+        # Bind attributes used once per transaction to locals for the loops below.
+        validate_kwargs = self._validate_kwargs
+        if self._validate_transactions is not None:
+            validations = await self._validate_transactions(prechecked, "front_run", **validate_kwargs)
+        else:
+            validate_transaction = self._validate_transaction
+            validations = await asyncio.gather(*(
+                validate_transaction(tx, "front_run", **validate_kwargs)
+                for tx in prechecked
+            ))
+        if len(validations) != len(prechecked):
+            raise ValueError(
+                f"Expected {len(prechecked)} validation results, got {len(validations)}"
+            )
+
+        candidates = [
+            (index, token_symbol)
+            for index, (valid, decoded_tx, token_symbol) in zip(indices, validations)
+            if valid
+        ]
+        if not candidates:
+            return results
+
+        score = self._score
+        scores = await asyncio.gather(*(
+            score(txs[index], token_symbol) for index, token_symbol in candidates
+        ), return_exceptions=True)
+
+        accepts = self._accepts
+        front_run = self._front_run
+        logger = self._logger
+        for (index, token_symbol), candidate_score in zip(candidates, scores):
+            if isinstance(candidate_score, BaseException):
+                logger.warning("Failed to score %s: %r", token_symbol, candidate_score)
+                continue
+            if candidate_score is not None and accepts(candidate_score, token_symbol):
+                try:
+                    results[index] = await front_run(txs[index])
+                except Exception as e:
+                    logger.warning("Front-run for %s failed: %r", token_symbol, e)
+
+        return results
+
+    def precheck(self, target_tx: Dict[str, Any]) -> bool:
+        """
+        Applies :func:`cheap_precheck` with ``FRONT_RUN_MIN_VALUE_WEI`` and
+        ``FRONT_RUN_ROUTER_ALLOWLIST`` from the configuration.
+        """
+        return cheap_precheck(target_tx, self._min_value_wei, self._router_allowlist)
+
+    def validates_like(self, validate_transaction_func: Callable[..., Awaitable[Any]]) -> bool:
+        """
+        Returns True if ``execute`` validates by calling ``validate_transaction_func``
+        without extra arguments, so its result can be passed as ``validation``.
+        """
+        return not self._validate_kwargs and self._validate_transaction == validate_transaction_func
+
+    def _set_threshold(self, value: Any) -> None:
+        # Thresholds are kept in whole points, see ScoringSpec.default_threshold.
+        threshold = int(value)
+        if threshold != value:
+            raise ValueError(
+                f"{self.spec.threshold_key} must be a whole number of points, got {value!r}"
+            )
+        self._threshold = threshold
+
+    async def _score(self, target_tx: Dict[str, Any], token_symbol: str) -> Optional[float]:
+        spec = self.spec
+        dependencies = self.dependencies
+
+        try:
+            awaitables = spec.data_fetchers(dependencies, target_tx, token_symbol)
+            if len(awaitables) == 1:
+                # Nothing to overlap, so skip the task and TaskGroup scheduling,
+                # which dominates the cost of a cached lookup.
+                (name, awaitable), = awaitables.items()
+                data = {name: await awaitable}
+            else:
+                data = await _gather_data(awaitables)
+        except Exception as e:
+            error = e.exceptions[0] if isinstance(e, ExceptionGroup) else e
+            self._logger.warning("Failed to gather complete market data: %r", error)
+            return None
+
+        for name in spec.required:
+            if data[name] is None:
+                self._logger.debug("Missing %s for analysis. Skipping...", name)
+                return None
+
+        score = await spec.score_fn(dependencies, target_tx, token_symbol, data)
+
+        if spec.describe is not None and self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(spec.describe(token_symbol, data, score))
+
+        return score
+
+    def _accepts(self, score: float, token_symbol: str) -> bool:
+        if score >= self._threshold:
+            self._logger.debug(
+                "Executing %s front-run for %s (Score: %s/100)",
+                self.spec.name.lower(), token_symbol, score
+            )
+            return True
+
+        self._logger.debug(
+            "%s score %s/100 below threshold. Skipping front-run.", self.spec.name, score
+        )
+        return False
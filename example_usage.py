@@ -53,7 +53,9 @@ class MockMarketMonitor:
 
     async def check_market_conditions(self, contract_address):
         print("MockMarketMonitor: Checking market conditions")
-        return {"bullish_trend": True, "high_volatility": True, "low_liquidity": False} # Example bullish, volatile market
+        # Example bullish, volatile market; "flags" packs the three booleans
+        # (bit 0 = bullish, bit 1 = volatile, bit 2 = liquid).
+        return {"bullish_trend": True, "high_volatility": True, "low_liquidity": False, "flags": 0b111}
 
 
 class MockConfiguration:
@@ -85,12 +87,14 @@ async def main():
     # --- Example target transaction ---
     example_transaction = {
         "to": "0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D", # Uniswap Router (example address)
-        "data": "0x...",
-        "value": "0.01", # Example ETH value
+        "data": "0x7ff36ab5...", # swapExactETHForTokens calldata (example)
+        "value": "0x2386f26fc10000", # 0.01 ETH in wei
         # ... more transaction details ...
     }
 
     # --- Initialize Strategy Instances, passing in dependencies ---
+    # Strategies built with the same functions share their cached lookups through
+    # the default MarketDataCache and MarketConditionsCache.
     aggressive_strategy = AggressiveFrontRunStrategy(
         validate_transaction_func=transaction_core._validate_transaction,
         calculate_risk_score_func=transaction_core._calculate_risk_score,
@@ -132,19 +136,25 @@ async def main():
     )
 
 
-    # --- Execute the strategies ---
-    result_aggressive = await aggressive_strategy.execute(example_transaction)
-    print(f"Aggressive Front-Run Result: {result_aggressive}")
+    # --- Execute the strategies concurrently ---
+    result_aggressive, result_predictive, result_volatility, result_advanced = await asyncio.gather(
+        aggressive_strategy.execute(example_transaction),
+        predictive_strategy.execute(example_transaction),
+        volatility_strategy.execute(example_transaction),
+        advanced_strategy.execute(example_transaction),
+    )
 
-    result_predictive = await predictive_strategy.execute(example_transaction)
+    print(f"Aggressive Front-Run Result: {result_aggressive}")
     print(f"Predictive Front-Run Result: {result_predictive}")
-
-    result_volatility = await volatility_strategy.execute(example_transaction)
     print(f"Volatility Front-Run Result: {result_volatility}")
-
-    result_advanced = await advanced_strategy.execute(example_transaction)
     print(f"Advanced Front-Run Result: {result_advanced}")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop's C event loop cuts per-task overhead; fall back to asyncio if not installed.
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
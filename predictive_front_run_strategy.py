@@ -1,11 +1,86 @@
-import asyncio
-import logging
-from typing import Dict, Any, Callable, Awaitable
-import numpy as np
+import math
+import time
+from typing import Dict, Any, Callable, Awaitable, Optional, Sequence
 
-logger = logging.getLogger(__name__)
+from .caching import (
+    MarketConditionsCache, MarketDataCache, cache_price_data, shared_market_conditions_cache,
+    shared_price_cache
+)
+from .core import Dependencies, FrontRunStrategy, ScoringSpec
 
-class PredictiveFrontRunStrategy:
+
+def _coefficient_of_variation(prices: Sequence[float]) -> float:
+    """
+    Computes the coefficient of variation (population std / mean) of prices.
+
+    Both passes go through ``math.fsum``, which sums in C with exact rounding
+    and is cheaper than NumPy dispatch for the short price lists used here.
+    Returns 0 for fewer than two prices or a zero mean.
+    """
+    n = len(prices)
+    if n < 2:
+        return 0.0
+    mean = math.fsum(prices) / n
+    if mean == 0:
+        return 0.0
+    variance = math.fsum([(price - mean) * (price - mean) for price in prices]) / n
+    return math.sqrt(variance) / mean
+
+
+def _fetch_data(
+    deps: Dependencies, target_tx: Dict[str, Any], token_symbol: str
+) -> Dict[str, Awaitable[Any]]:
+    contract_address = target_tx["to"]
+    return {
+        "predicted_price": deps["predict_price_movement"](token_symbol),
+        "current_price": deps["get_real_time_price"](token_symbol),
+        "market_conditions": deps["check_market_conditions"](contract_address),
+        "historical_prices": deps["get_token_price_data"](token_symbol, 'historical', timeframe=1),
+    }
+
+
+async def _score(
+    deps: Dependencies, target_tx: Dict[str, Any], token_symbol: str, data: Dict[str, Any]
+) -> float:
+    historical_prices = data["historical_prices"]
+    price_change = (data["predicted_price"] / float(data["current_price"]) - 1) * 100
+    volatility = _coefficient_of_variation(historical_prices) if historical_prices else 0
+    data["price_change"] = price_change
+    data["volatility"] = volatility
+
+    return await deps["calculate_opportunity_score"](
+        price_change=price_change,
+        volatility=volatility,
+        market_conditions=data["market_conditions"],
+        current_price=data["current_price"],
+        historical_prices=historical_prices
+    )
+
+
+def _describe(token_symbol: str, data: Dict[str, Any], opportunity_score: float) -> str:
+    return (
+        f"Predictive Analysis for {token_symbol}:\n"
+        f"Current Price: {data['current_price']:.6f}\n"
+        f"Predicted Price: {data['predicted_price']:.6f}\n"
+        f"Expected Change: {data['price_change']:.2f}%\n"
+        f"Volatility: {data['volatility']:.2f}\n"
+        f"Opportunity Score: {opportunity_score}/100\n"
+        f"Market Conditions: {data['market_conditions']}"
+    )
+
+
+PREDICTIVE_SPEC = ScoringSpec(
+    name="Predictive",
+    threshold_key="FRONT_RUN_OPPORTUNITY_SCORE_THRESHOLD",
+    default_threshold=60,
+    data_fetchers=_fetch_data,
+    score_fn=_score,
+    required=("current_price", "predicted_price"),
+    describe=_describe,
+)
+
+
+class PredictiveFrontRunStrategy(FrontRunStrategy):
     """
     Predictive front-run strategy class.
 
@@ -13,6 +88,8 @@ class PredictiveFrontRunStrategy:
     to assess the opportunity for a profitable front-run.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         validate_transaction_func: Callable[..., Awaitable[tuple[bool, dict, str]]],
@@ -22,7 +99,11 @@ class PredictiveFrontRunStrategy:
         get_real_time_price_func: Callable[[str], Awaitable[float]],
         check_market_conditions_func: Callable[[str], Awaitable[dict]],
         get_token_price_data_func: Callable[[str, str, int], Awaitable[list[float]]],
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        market_conditions_cache: Optional[MarketConditionsCache] = None,
+        disk_cache_dir: Optional[str] = None,
+        price_cache: Optional[MarketDataCache] = None,
+        disk_cache_timer: Callable[[], float] = time.time
     ):
         """
         Initializes the PredictiveFrontRunStrategy.
@@ -36,83 +117,42 @@ class PredictiveFrontRunStrategy:
             check_market_conditions_func: Asynchronous function to check market conditions.
             get_token_price_data_func: Asynchronous function to get historical price data.
             config: Configuration dictionary.
+            market_conditions_cache: Cache used for market conditions lookups. Defaults
+                to the process-wide cache shared by all strategies.
+            disk_cache_dir: Optional directory for a persistent cache of historical
+                price data, e.g. to speed up repeated backtests.
+            price_cache: Cache used for price, prediction and price history lookups.
+                Defaults to the process-wide cache shared by all strategies.
+            disk_cache_timer: Clock the persistent cache is keyed by, e.g. a function
+                returning the replayed block timestamp so that backtest re-runs hit
+                the same entries. Defaults to the wall clock.
         """
-        self._validate_transaction = validate_transaction_func
-        self._calculate_opportunity_score = calculate_opportunity_score_func
-        self._front_run = front_run_func
-        self._predict_price_movement = predict_price_movement_func
-        self._get_real_time_price = get_real_time_price_func
-        self._check_market_conditions = check_market_conditions_func
-        self._get_token_price_data = get_token_price_data_func
-        self.config = config
-        self.opportunity_score_threshold = config.get("FRONT_RUN_OPPORTUNITY_SCORE_THRESHOLD", 60) # Default
-
-    async def execute(self, target_tx: Dict[str, Any]) -> bool:
-        """
-        Executes the predictive front-run strategy.
-
-        Args:
-            target_tx: The target transaction dictionary.
-
-        Returns:
-            True if front-run was executed, False otherwise.
-        """
-        logger.debug("Initiating  Predictive Front-Run Strategy...")
-
-        valid, decoded_tx, token_symbol = await self._validate_transaction(
-            target_tx, "front_run"
-        )
-        if not valid:
-            return False
-
-        try:
-            data = await asyncio.gather(
-                self._predict_price_movement(token_symbol),
-                self._get_real_time_price(token_symbol),
-                self._check_market_conditions(target_tx["to"]),
-                self._get_token_price_data(token_symbol, 'historical', timeframe=1),
-                return_exceptions=True
-            )
-            predicted_price, current_price, market_conditions, historical_prices = data
-
-            if any(isinstance(x, Exception) for x in data):
-                logger.warning("Failed to gather complete market data.")
-                return False
-
-            if current_price is None or predicted_price is None:
-                logger.debug("Missing price data for analysis.")
-                return False
-
-        except Exception as e:
-            logger.error(f"Error gathering market data: {e}")
-            return False
-
-        opportunity_score = await self._calculate_opportunity_score(
-            price_change= (predicted_price / float(current_price) - 1) * 100,
-            volatility=np.std(historical_prices) / np.mean(historical_prices) if historical_prices else 0,
-            market_conditions=market_conditions,
-            current_price=current_price,
-            historical_prices=historical_prices
+        price_cache = price_cache or shared_price_cache
+        super().__init__(
+            PREDICTIVE_SPEC,
+            validate_transaction_func,
+            front_run_func,
+            dependencies={
+                "calculate_opportunity_score": calculate_opportunity_score_func,
+                "predict_price_movement": price_cache.wrap(predict_price_movement_func),
+                "get_real_time_price": price_cache.wrap(get_real_time_price_func),
+                "check_market_conditions": (
+                    market_conditions_cache or shared_market_conditions_cache
+                ).wrap(check_market_conditions_func),
+                "get_token_price_data": cache_price_data(
+                    get_token_price_data_func,
+                    disk_cache_dir,
+                    price_cache,
+                    disk_cache_timer
+                ),
+            },
+            config=config,
         )
 
-        logger.debug(
-            f"Predictive Analysis for {token_symbol}:\n"
-            f"Current Price: {current_price:.6f}\n"
-            f"Predicted Price: {predicted_price:.6f}\n"
-            f"Expected Change: {(predicted_price / float(current_price) - 1) * 100:.2f}%\n"
-            f"Volatility: {np.std(historical_prices) / np.mean(historical_prices) if historical_prices else 0:.2f}\n"
-            f"Opportunity Score: {opportunity_score}/100\n"
-            f"Market Conditions: {market_conditions}"
-        )
-
-        if opportunity_score >= self.opportunity_score_threshold:
-            logger.debug(
-                f"Executing predictive front-run for {token_symbol} "
-                f"(Score: {opportunity_score}/100, Expected Change: {(predicted_price / float(current_price) - 1) * 100:.2f}%)"
-            )
-            return await self._front_run(target_tx)
+    @property
+    def opportunity_score_threshold(self) -> int:
+        return self.threshold
 
-        logger.debug(
-            f"Opportunity score {opportunity_score}/100 below threshold. Skipping front-run."
-        )
-        return False
+    @opportunity_score_threshold.setter
+    def opportunity_score_threshold(self, value: int) -> None:
+        self._set_threshold(value)
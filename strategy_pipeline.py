@@ -0,0 +1,193 @@
+import asyncio
+import logging
+from typing import Dict, Any, Callable, Awaitable, Iterable, List, Optional, Sequence
+
+from .caching import (
+    MarketConditionsCache, MarketDataCache, shared_market_conditions_cache, shared_price_cache
+)
+from .core import FrontRunStrategy, cheap_precheck
+
+logger = logging.getLogger(__name__)
+
+class StrategyPipeline:
+    """
+    Runs a set of strategies over a sequence of target transactions.
+
+    While the strategies execute for one transaction, the pipeline validates
+    the next one and speculatively starts its market data lookups. The results
+    land in the same caches the strategies read from, so the next execute()
+    finds them already resolved or in flight. Lookups for transactions that
+    turn out to be uninteresting are simply left to expire. Transactions every
+    strategy rejects in its pre-check are not prefetched, and strategies
+    validating with the pipeline's validator reuse its result.
+    """
+
+    __slots__ = (
+        "strategies",
+        "_validate_transaction",
+        "_symbol_prefetch_funcs",
+        "_address_prefetch_funcs",
+        "_prechecks",
+        "_shares_validation",
+        "_prefetch_tasks",
+    )
+
+    def __init__(
+        self,
+        strategies: Sequence[Any],
+        validate_transaction_func: Callable[..., Awaitable[tuple[bool, dict, str]]],
+        symbol_prefetch_funcs: Sequence[Callable[[str], Awaitable[Any]]] = (),
+        address_prefetch_funcs: Sequence[Callable[[str], Awaitable[Any]]] = (),
+        market_conditions_cache: Optional[MarketConditionsCache] = None,
+        price_cache: Optional[MarketDataCache] = None
+    ):
+        """
+        Initializes the StrategyPipeline.
+
+        Prefetching only pays off if the strategies read from the same caches.
+        Symbol and address functions are wrapped through the same price and
+        market conditions caches as the strategies, which hand out the clients
+        the strategies already use. A function no :class:`FrontRunStrategy`
+        reads through those caches is rejected, since prefetching it would
+        only add upstream calls.
+
+        Args:
+            strategies: Strategy instances providing an ``execute`` coroutine.
+            validate_transaction_func: Asynchronous function to validate a transaction.
+            symbol_prefetch_funcs: Asynchronous functions taking a token symbol to warm.
+            address_prefetch_funcs: Asynchronous functions taking a contract address to warm.
+            market_conditions_cache: Cache used for address lookups. Defaults to the
+                process-wide cache shared by all strategies.
+            price_cache: Cache used for symbol lookups. Defaults to the process-wide
+                cache shared by all strategies.
+
+        Raises:
+            TypeError: If a prefetch function is not used by any strategy.
+        """
+        cache = market_conditions_cache or shared_market_conditions_cache
+        price_cache = price_cache or shared_price_cache
+        self.strategies = tuple(strategies)
+        self._validate_transaction = validate_transaction_func
+        self._symbol_prefetch_funcs = tuple(price_cache.wrap(func) for func in symbol_prefetch_funcs)
+        self._address_prefetch_funcs = tuple(cache.wrap(func) for func in address_prefetch_funcs)
+        # Strategies of other types may read the clients in ways that cannot be
+        # checked, so only verify pipelines built from FrontRunStrategy instances.
+        if all(isinstance(strategy, FrontRunStrategy) for strategy in self.strategies):
+            used = {
+                id(dependency)
+                for strategy in self.strategies
+                for dependency in strategy.dependencies.values()
+            }
+            prefetch_funcs = zip(
+                (*symbol_prefetch_funcs, *address_prefetch_funcs),
+                self._symbol_prefetch_funcs + self._address_prefetch_funcs
+            )
+            for func, client in prefetch_funcs:
+                if id(client) not in used:
+                    raise TypeError(
+                        f"No strategy reads {func!r} through the pipeline's caches, "
+                        "prefetching it would only add upstream calls"
+                    )
+        self._prechecks = tuple(
+            strategy.precheck if isinstance(strategy, FrontRunStrategy) else cheap_precheck
+            for strategy in self.strategies
+        )
+        self._shares_validation = tuple(
+            isinstance(strategy, FrontRunStrategy)
+            and strategy.validates_like(validate_transaction_func)
+            for strategy in self.strategies
+        )
+        self._prefetch_tasks: set[asyncio.Future] = set()
+
+    async def execute(
+        self,
+        target_tx: Dict[str, Any],
+        validation: Optional[tuple[bool, dict, str]] = None
+    ) -> List[bool]:
+        """
+        Executes all strategies concurrently for one target transaction.
+
+        Args:
+            target_tx: The target transaction dictionary.
+            validation: Result of ``validate_transaction_func`` for ``target_tx`` if
+                already known, reused by the strategies validating the same way.
+
+        Returns:
+            One entry per strategy, True if it executed a front-run.
+        """
+        if validation is None:
+            return list(await asyncio.gather(
+                *(strategy.execute(target_tx) for strategy in self.strategies)
+            ))
+        return list(await asyncio.gather(*(
+            strategy.execute(target_tx, validation) if shares else strategy.execute(target_tx)
+            for strategy, shares in zip(self.strategies, self._shares_validation)
+        )))
+
+    async def run(self, target_txs: Iterable[Dict[str, Any]]) -> List[List[bool]]:
+        """
+        Executes all strategies for each transaction in order, prefetching ahead.
+
+        Args:
+            target_txs: The target transactions, in the order they should be handled.
+
+        Returns:
+            The ``execute`` result for each transaction.
+        """
+        results = []
+        pending = iter(target_txs)
+        current = next(pending, None)
+        validation: Optional[asyncio.Future] = None
+        try:
+            while current is not None:
+                upcoming = next(pending, None)
+                upcoming_validation = None if upcoming is None else self._start_prefetch(upcoming)
+                results.append(await self.execute(current, await self._validation_result(validation)))
+                current, validation = upcoming, upcoming_validation
+        finally:
+            for task in self._prefetch_tasks:
+                task.cancel()
+        return results
+
+    def _start_prefetch(self, target_tx: Dict[str, Any]) -> Optional[asyncio.Future]:
+        if not any(precheck(target_tx) for precheck in self._prechecks):
+            return None
+        validation = self._track(asyncio.ensure_future(
+            self._validate_transaction(target_tx, "front_run")
+        ))
+        self._track(asyncio.ensure_future(self._prefetch(target_tx, validation)))
+        return validation
+
+    def _track(self, task: asyncio.Future) -> asyncio.Future:
+        self._prefetch_tasks.add(task)
+        task.add_done_callback(self._prefetch_tasks.discard)
+        return task
+
+    @staticmethod
+    async def _validation_result(
+        validation: Optional[asyncio.Future]
+    ) -> Optional[tuple[bool, dict, str]]:
+        if validation is None:
+            return None
+        try:
+            return await validation
+        except Exception:
+            # The strategies validate again and report the error themselves.
+            return None
+
+    async def _prefetch(self, target_tx: Dict[str, Any], validation: asyncio.Future) -> None:
+        try:
+            valid, decoded_tx, token_symbol = await validation
+            if not valid:
+                return
+            address = target_tx["to"]
+        except Exception as e:
+            logger.debug("Skipping prefetch for unvalidated transaction: %r", e)
+            return
+
+        # Failures are ignored here, execute() will retry and report them.
+        await asyncio.gather(
+            *(func(token_symbol) for func in self._symbol_prefetch_funcs),
+            *(func(address) for func in self._address_prefetch_funcs),
+            return_exceptions=True
+        )
@@ -1,10 +1,56 @@
-import asyncio
-import logging
-from typing import Dict, Any, Callable, Awaitable
-
-logger = logging.getLogger(__name__)
-
-class VolatilityFrontRunStrategy:
+import time
+from typing import Dict, Any, Callable, Awaitable, Optional
+
+from .caching import (
+    MarketConditionsCache, MarketDataCache, cache_price_data, shared_market_conditions_cache,
+    shared_price_cache
+)
+from .core import Dependencies, FrontRunStrategy, ScoringSpec
+
+
+def _fetch_data(
+    deps: Dependencies, target_tx: Dict[str, Any], token_symbol: str
+) -> Dict[str, Awaitable[Any]]:
+    contract_address = target_tx["to"]
+    return {
+        "market_conditions": deps["check_market_conditions"](contract_address),
+        "current_price": deps["get_real_time_price"](token_symbol),
+        "historical_prices": deps["get_token_price_data"](token_symbol, 'historical', timeframe=1),
+    }
+
+
+async def _score(
+    deps: Dependencies, target_tx: Dict[str, Any], token_symbol: str, data: Dict[str, Any]
+) -> float:
+    return await deps["calculate_volatility_score"](
+        historical_prices=data["historical_prices"],
+        current_price=data["current_price"],
+        market_conditions=data["market_conditions"]
+    )
+
+
+def _describe(token_symbol: str, data: Dict[str, Any], volatility_score: float) -> str:
+    historical_prices = data["historical_prices"]
+    return (
+        f"Volatility Analysis for {token_symbol}:\n"
+        f"Volatility Score: {volatility_score:.2f}/100\n"
+        f"Current Price: {data['current_price']}\n"
+        f"24h Price Range: {min(historical_prices):.4f} - {max(historical_prices):.4f}\n"
+        f"Market Conditions: {data['market_conditions']}"
+    )
+
+
+VOLATILITY_SPEC = ScoringSpec(
+    name="Volatility",
+    threshold_key="VOLATILITY_FRONT_RUN_SCORE_THRESHOLD",
+    default_threshold=75,
+    data_fetchers=_fetch_data,
+    score_fn=_score,
+    describe=_describe,
+)
+
+
+class VolatilityFrontRunStrategy(FrontRunStrategy):
     """
     Volatility-based front-run strategy class.
 
@@ -12,6 +58,8 @@ class VolatilityFrontRunStrategy:
     opportunities.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         validate_transaction_func: Callable[..., Awaitable[tuple[bool, dict, str]]],
@@ -20,7 +68,11 @@ class VolatilityFrontRunStrategy:
         check_market_conditions_func: Callable[[str], Awaitable[dict]],
         get_real_time_price_func: Callable[[str], Awaitable[float]],
         get_token_price_data_func: Callable[[str, str, int], Awaitable[list[float]]],
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        market_conditions_cache: Optional[MarketConditionsCache] = None,
+        disk_cache_dir: Optional[str] = None,
+        price_cache: Optional[MarketDataCache] = None,
+        disk_cache_timer: Callable[[], float] = time.time
     ):
         """
         Initializes the VolatilityFrontRunStrategy.
@@ -33,74 +85,41 @@ class VolatilityFrontRunStrategy:
             get_real_time_price_func: Asynchronous function to get real-time price.
             get_token_price_data_func: Asynchronous function to get historical price data.
             config: Configuration dictionary.
+            market_conditions_cache: Cache used for market conditions lookups. Defaults
+                to the process-wide cache shared by all strategies.
+            disk_cache_dir: Optional directory for a persistent cache of historical
+                price data, e.g. to speed up repeated backtests.
+            price_cache: Cache used for price and price history lookups. Defaults
+                to the process-wide cache shared by all strategies.
+            disk_cache_timer: Clock the persistent cache is keyed by, e.g. a function
+                returning the replayed block timestamp so that backtest re-runs hit
+                the same entries. Defaults to the wall clock.
         """
-        self._validate_transaction = validate_transaction_func
-        self._calculate_volatility_score = calculate_volatility_score_func
-        self._front_run = front_run_func
-        self._check_market_conditions = check_market_conditions_func
-        self._get_real_time_price = get_real_time_price_func
-        self._get_token_price_data = get_token_price_data_func
-        self.config = config
-        self.volatility_score_threshold = config.get("VOLATILITY_FRONT_RUN_SCORE_THRESHOLD", 75) # Default
-
-    async def execute(self, target_tx: Dict[str, Any]) -> bool:
-        """
-        Executes the volatility-based front-run strategy.
-
-        Args:
-            target_tx: The target transaction dictionary.
-
-        Returns:
-            True if front-run was executed, False otherwise.
-        """
-        logger.debug("Initiating  Volatility Front-Run Strategy...")
-
-        valid, decoded_tx, token_symbol = await self._validate_transaction(
-            target_tx, "front_run"
-        )
-        if not valid:
-            return False
-
-        try:
-            results = await asyncio.gather(
-                self._check_market_conditions(target_tx["to"]),
-                self._get_real_time_price(token_symbol),
-                 self._get_token_price_data(token_symbol, 'historical', timeframe=1),
-                return_exceptions=True
-            )
-
-            market_conditions, current_price, historical_prices = results
-
-            if any(isinstance(result, Exception) for result in results):
-                logger.warning("Failed to gather complete market data")
-                return False
-
-        except Exception as e:
-            logger.error(f"Error gathering market data: {e}")
-            return False
-
-        volatility_score = await self._calculate_volatility_score(
-            historical_prices=historical_prices,
-            current_price=current_price,
-            market_conditions=market_conditions
+        price_cache = price_cache or shared_price_cache
+        super().__init__(
+            VOLATILITY_SPEC,
+            validate_transaction_func,
+            front_run_func,
+            dependencies={
+                "calculate_volatility_score": calculate_volatility_score_func,
+                "check_market_conditions": (
+                    market_conditions_cache or shared_market_conditions_cache
+                ).wrap(check_market_conditions_func),
+                "get_real_time_price": price_cache.wrap(get_real_time_price_func),
+                "get_token_price_data": cache_price_data(
+                    get_token_price_data_func,
+                    disk_cache_dir,
+                    price_cache,
+                    disk_cache_timer
+                ),
+            },
+            config=config,
         )
 
-        logger.debug(
-            f"Volatility Analysis for {token_symbol}:\n"
-            f"Volatility Score: {volatility_score:.2f}/100\n"
-            f"Current Price: {current_price}\n"
-            f"24h Price Range: {min(historical_prices):.4f} - {max(historical_prices):.4f}\n"
-            f"Market Conditions: {market_conditions}"
-        )
-
-        if volatility_score >= self.volatility_score_threshold:
-            logger.debug(
-                f"Executing volatility-based front-run for {token_symbol} "
-                f"(Volatility Score: {volatility_score:.2f}/100)"
-            )
-            return await self._front_run(target_tx)
+    @property
+    def volatility_score_threshold(self) -> int:
+        return self.threshold
 
-        logger.debug(
-            f"Volatility score {volatility_score:.2f}/100 below threshold. Skipping front-run."
-        )
-        return False
+    @volatility_score_threshold.setter
+    def volatility_score_threshold(self, value: int) -> None:
+        self._set_threshold(value)